@@ -1,13 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, BinaryIO
 from io import BytesIO
 import os
 import datetime
 
+import numpy as np
+import openpyxl
 import pandas as pd
-
-from silver_to_gold import build_lea_joined_gold
-from storage_io import load_storage_config, read_bytes, write_bytes
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pandas.io.parsers import TextParser
+
+from silver_to_gold import ARROW_TO_PANDAS_DTYPES, build_lea_joined_gold
+from storage_io import (
+    StorageConfig,
+    last_modified,
+    load_storage_config,
+    open_read,
+    read_bytes,
+    write_parquet,
+)
+
+
+# Columns the silver step needs from the school performance workbook.
+_SCHOOL_COLUMNS = ["schoolid", "schoolname", "systemid", "systemname", "single_score_23"]
+
+# ACS S2503 estimate columns kept in silver, mapped to their silver names.
+_HOUSING_NUMERIC_COLUMNS = {
+    "S2503_C01_001E": "occupied_housing_units",
+    "S2503_C01_028E": "inc_lt_20k_cost_burden_30_plus",
+    "S2503_C01_032E": "inc_20k_34_999_cost_burden_30_plus",
+    "S2503_C01_036E": "inc_35k_49_999_cost_burden_30_plus",
+    "S2503_C01_040E": "inc_50k_74_999_cost_burden_30_plus",
+    "S2503_C01_044E": "inc_75k_plus_cost_burden_30_plus",
+}
+
+# ACS markers for suppressed / not-available estimates.
+_ACS_NA_VALUES = ["-", "N", "(X)", "**", "***", "*****"]
+
+# pandas' default NA tokens for read_csv: pyarrow's defaults plus "<NA>" and "None".
+# Passing null_values to the Arrow reader replaces its defaults, so list them explicitly.
+_CSV_DEFAULT_NA_VALUES = [*pacsv.ConvertOptions().null_values, "<NA>", "None"]
+
+# Columns the silver step needs from the special education CSV.
+_SPECIAL_COLUMNS = [
+    "State LEA ID",
+    "LEA Name",
+    "School Age All Educational Environments",
+    "School Age Inside regular class 80% or more of the day",
+    "School Year",
+]
+
+# Silver storage types for numeric columns, applied after all arithmetic (done in float64).
+# ACS counts (<= ~10^7) and percentages fit float32; special-ed counts fit int32.
+_HOUSING_FLOAT32_COLUMNS = [*_HOUSING_NUMERIC_COLUMNS.values(), "total_cost_burden_30_plus_pct"]
+
+# Strings pd.to_numeric parses as numbers: signed decimals ("+5", ".5", "5."), exponents
+# ("1e3") and infinities. "nan" is left out so it ends up null, as the pandas path's
+# NaN does once cast to a nullable dtype.
+_NUMERIC_STRING_RE = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+_INFINITY_STRING_RE = r"^[+-]?(inf|infinity)$"
 
 
 def _ingest_date() -> str:
@@ -24,6 +79,7 @@ def _paths(ingest_date: str) -> Dict[str, str]:
         "bronze_housing": f"bronze/housing_affordability/ingest_date={ingest_date}/housing2019-23.csv",
         "bronze_special": f"bronze/special_education/ingest_date={ingest_date}/special_education2022-23.csv",
         "bronze_school": f"bronze/school_performance/ingest_date={ingest_date}/school_performance.xlsx",
+        "bronze_school_parquet": f"bronze/school_performance/ingest_date={ingest_date}/school_performance.parquet",
         "silver_housing": f"silver/housing_affordability/ingest_date={ingest_date}/housing2019-23.parquet",
         "silver_special": f"silver/special_education/ingest_date={ingest_date}/special_education2022-23.parquet",
         "silver_school": f"silver/school_performance/ingest_date={ingest_date}/school_performance2023.parquet",
@@ -31,9 +87,210 @@ def _paths(ingest_date: str) -> Dict[str, str]:
     }
 
 
-def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def _xlsx_cell_value(cell: Any) -> Any:
+    # Same conversion pandas' openpyxl reader applies before parsing: empty cells are
+    # "" (parsed as NA), error cells are NaN, and integral numbers become ints.
+    if cell is None or cell.value is None:
+        return ""
+    if cell.data_type == "e":
+        return np.nan
+    if cell.data_type == "n":
+        as_int = int(cell.value)
+        return as_int if as_int == cell.value else float(cell.value)
+    return cell.value
+
+
+def _read_xlsx_columns(data: bytes, columns: List[str], sheet: int = 0) -> pd.DataFrame:
     """
-    Read bronze inputs and return the cleaned (silver) DataFrames in-memory:
+    Read selected columns of a worksheet (header in the first row) into a DataFrame.
+
+    Streams the sheet with openpyxl in read-only mode and only keeps the requested
+    columns, then hands the rows to the same ``TextParser`` ``pd.read_excel`` uses, so
+    values are inferred identically (numbers stored as text such as ``"0601"`` become
+    ``601``, error cells and empty cells become missing, interior empty rows are kept
+    and trailing ones dropped).
+    """
+    wb = openpyxl.load_workbook(BytesIO(data), read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[sheet]
+        # Read-only sheets trust the <dimension> record, which can be wrong and
+        # truncate the data; recompute it the same way pandas does.
+        ws.reset_dimensions()
+        rows = ws.iter_rows()
+        header = [cell.value for cell in next(rows, ())]
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise ValueError(f"Columns not found in worksheet header: {missing}")
+        idx = [header.index(c) for c in columns]
+
+        records: List[list] = [list(columns)]
+        n_rows = 1  # header plus rows up to and including the last non-empty one
+        for row in rows:
+            records.append([_xlsx_cell_value(row[i] if i < len(row) else None) for i in idx])
+            if any(cell.value is not None for cell in row):
+                n_rows = len(records)
+    finally:
+        wb.close()
+
+    with TextParser(records[:n_rows], header=0, skip_blank_lines=False) as parser:
+        return parser.read()
+
+
+def xlsx_to_parquet(base_dir: Path) -> str:
+    """
+    Ingest pre-step: convert the school performance workbook to a Parquet bronze
+    artifact stored next to it, so downstream reads skip XLSX parsing entirely.
+
+    The artifact is reused while it is at least as new as the workbook, and rebuilt
+    when it is missing or the workbook has been re-uploaded since.
+    Returns the relative path of the Parquet artifact.
+    """
+    cfg = load_storage_config(base_dir)
+    p = _paths(_ingest_date())
+    parquet_path = p["bronze_school_parquet"]
+
+    built_at = last_modified(cfg, parquet_path)
+    source_at = last_modified(cfg, p["bronze_school"])
+    if built_at is not None and (source_at is None or built_at >= source_at):
+        return parquet_path
+
+    school_raw = _read_xlsx_columns(read_bytes(cfg, p["bronze_school"]), _SCHOOL_COLUMNS)
+
+    write_parquet(cfg, parquet_path, school_raw)
+    return parquet_path
+
+
+def _read_housing_table(cfg: StorageConfig, relative_path: str) -> pa.Table:
+    """
+    Arrow variant of ``_read_housing_csv`` using the multithreaded pyarrow CSV reader.
+    """
+    with open_read(cfg, relative_path) as f:
+        return pacsv.read_csv(
+            f,
+            read_options=pacsv.ReadOptions(skip_rows_after_names=1),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=["GEO_ID", "NAME", *_HOUSING_NUMERIC_COLUMNS],
+                column_types={
+                    "GEO_ID": pa.string(),
+                    "NAME": pa.string(),
+                    **{c: pa.float64() for c in _HOUSING_NUMERIC_COLUMNS},
+                },
+                null_values=[*_CSV_DEFAULT_NA_VALUES, *_ACS_NA_VALUES],
+                strings_can_be_null=True,
+            ),
+        )
+
+
+def _read_housing_csv(cfg: StorageConfig, relative_path: str) -> pd.DataFrame:
+    """
+    Read the ACS housing CSV, keeping only the columns used in silver.
+
+    Row 1 is the ACS label metadata row (GEO_ID == 'Geography'); it is skipped at
+    read time so the estimate columns can be parsed straight to numeric dtypes.
+    """
+    with open_read(cfg, relative_path) as f:
+        return pd.read_csv(
+            f,
+            usecols=["GEO_ID", "NAME", *_HOUSING_NUMERIC_COLUMNS],
+            dtype={
+                "GEO_ID": "string",
+                "NAME": "string",
+                **{c: "Float64" for c in _HOUSING_NUMERIC_COLUMNS},
+            },
+            skiprows=[1],
+            na_values=_ACS_NA_VALUES,
+        )
+
+
+def _skip_special_preamble(f: BinaryIO) -> None:
+    """
+    Advance the special education CSV stream to its real header line.
+
+    The file has 4 metadata lines above the header. Blank lines are not counted,
+    matching pandas ``header=4`` (which skips them), so both CSV readers start at
+    the same line whatever blank lines the export contains.
+    """
+    remaining = 4
+    while remaining:
+        line = f.readline()
+        if not line:
+            return
+        if line.strip():
+            remaining -= 1
+
+
+def _read_special_table(cfg: StorageConfig, relative_path: str) -> pa.Table:
+    """
+    Arrow variant of ``_read_special_csv`` using the multithreaded pyarrow CSV reader.
+    """
+    with open_read(cfg, relative_path) as f:
+        _skip_special_preamble(f)
+        return pacsv.read_csv(
+            f,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=_SPECIAL_COLUMNS,
+                column_types={"LEA Name": pa.string(), "School Year": pa.string()},
+                null_values=_CSV_DEFAULT_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+
+
+def _read_special_csv(cfg: StorageConfig, relative_path: str) -> pd.DataFrame:
+    """
+    Read the special education CSV, keeping only the columns used in silver.
+
+    The file has metadata rows above the real header; they are skipped by
+    ``_skip_special_preamble`` so the header is the first line read.
+    """
+    with open_read(cfg, relative_path) as f:
+        _skip_special_preamble(f)
+        return pd.read_csv(
+            f,
+            usecols=_SPECIAL_COLUMNS,
+            dtype={"LEA Name": "string", "School Year": "string"},
+        )
+
+
+def _to_float(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Cast a column to float64, turning non-numeric strings (suppression markers etc.) into
+    nulls, like ``pd.to_numeric(errors="coerce")``.
+    """
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pc.utf8_trim_whitespace(values)
+        is_number = pc.or_(
+            pc.match_substring_regex(values, _NUMERIC_STRING_RE),
+            pc.match_substring_regex(values, _INFINITY_STRING_RE, ignore_case=True),
+        )
+        values = pc.if_else(is_number, values, pa.scalar(None, values.type))
+    return pc.cast(values, pa.float64())
+
+
+def _null_if_zero(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pc.if_else(pc.equal(values, 0), pa.scalar(None, values.type), values)
+
+
+def _cast_columns(table: pa.Table, types: Dict[str, pa.DataType]) -> pa.Table:
+    for name, type_ in types.items():
+        i = table.schema.get_field_index(name)
+        table = table.set_column(i, name, pc.cast(table[name], type_))
+    return table
+
+
+def _as_frame(data: pd.DataFrame | pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas with the same nullable dtypes the pandas path uses.
+    """
+    if isinstance(data, pa.Table):
+        return data.to_pandas(types_mapper=ARROW_TO_PANDAS_DTYPES.get)
+    return data
+
+
+def build_silver_tables(base_dir: Path) -> tuple[pa.Table, pa.Table, pa.Table]:
+    """
+    Arrow-native variant of ``build_silver_frames``: read bronze inputs with pyarrow
+    and clean them with Arrow compute kernels, returning the silver tables:
       - housing_clean
       - school_clean
       - special_clean
@@ -43,60 +300,112 @@ def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
     p = _paths(ingest_date)
 
     # --- Load raw (bronze) data -------------------------------------------------
-    housing_path = p["bronze_housing"]
-    special_path = p["bronze_special"]
-    school_path = p["bronze_school"]
-
-    housing_raw = pd.read_csv(BytesIO(read_bytes(cfg, housing_path)))
-
-    school_raw = pd.read_excel(
-        BytesIO(read_bytes(cfg, school_path)),
-        engine="openpyxl",
+    housing_raw = _read_housing_table(cfg, p["bronze_housing"])
+    school_raw = pq.read_table(
+        BytesIO(read_bytes(cfg, xlsx_to_parquet(base_dir))), columns=_SCHOOL_COLUMNS
     )
-
-    # Special education CSV has metadata rows above the real header; use header row at index 4.
-    special_raw = pd.read_csv(BytesIO(read_bytes(cfg, special_path)), header=4)
+    special_raw = _read_special_table(cfg, p["bronze_special"])
 
     # --- Clean / transform data -------------------------------------------------
 
     # Housing dataset cleaning
-    # Drop the ACS metadata row (where GEO_ID == 'Geography') before selecting/renaming columns.
-    housing_clean = housing_raw[housing_raw["GEO_ID"] != "Geography"][
-        [
-            "GEO_ID",
-            "NAME",
-            "S2503_C01_001E",
-            "S2503_C01_028E",
-            "S2503_C01_032E",
-            "S2503_C01_036E",
-            "S2503_C01_040E",
-            "S2503_C01_044E",
-        ]
-    ].rename(
-        columns={
-            "NAME": "county_name",
-            "S2503_C01_001E": "occupied_housing_units",
-            "S2503_C01_028E": "inc_lt_20k_cost_burden_30_plus",
-            "S2503_C01_032E": "inc_20k_34_999_cost_burden_30_plus",
-            "S2503_C01_036E": "inc_35k_49_999_cost_burden_30_plus",
-            "S2503_C01_040E": "inc_50k_74_999_cost_burden_30_plus",
-            "S2503_C01_044E": "inc_75k_plus_cost_burden_30_plus",
-        }
-    ).reset_index(drop=True)
+    housing_names = {"NAME": "county_name", **_HOUSING_NUMERIC_COLUMNS}
+    housing_clean = housing_raw.rename_columns(
+        [housing_names.get(c, c) for c in housing_raw.column_names]
+    )
 
-    # Ensure numeric types for cost-burden and occupied-units columns.
-    housing_numeric_cols = [
-        "occupied_housing_units",
+    # Missing tiers count as zero; zero occupied units yields null rather than inf.
+    income_burden_cols = [
         "inc_lt_20k_cost_burden_30_plus",
         "inc_20k_34_999_cost_burden_30_plus",
         "inc_35k_49_999_cost_burden_30_plus",
         "inc_50k_74_999_cost_burden_30_plus",
         "inc_75k_plus_cost_burden_30_plus",
     ]
-    housing_clean[housing_numeric_cols] = housing_clean[housing_numeric_cols].apply(
-        pd.to_numeric, errors="coerce"
+    burden = pc.fill_null(housing_clean[income_burden_cols[0]], 0.0)
+    for col in income_burden_cols[1:]:
+        burden = pc.add(burden, pc.fill_null(housing_clean[col], 0.0))
+    occupied = _null_if_zero(housing_clean["occupied_housing_units"])
+    housing_clean = housing_clean.append_column(
+        "total_cost_burden_30_plus_pct", pc.multiply(pc.divide(burden, occupied), 100.0)
+    )
+    housing_clean = _cast_columns(
+        housing_clean, {c: pa.float32() for c in _HOUSING_FLOAT32_COLUMNS}
     )
 
+    # School performance dataset cleaning
+    school_clean = school_raw.select(_SCHOOL_COLUMNS).rename_columns(
+        ["school_id", "school_name", "lea_id", "district_name", "ccrpi_score_2023"]
+    )
+    school_clean = _cast_columns(school_clean, {"ccrpi_score_2023": pa.float32()})
+
+    # Special education dataset cleaning (IDEA environments)
+    total_swd = _to_float(special_raw["School Age All Educational Environments"])
+    inclusive = _to_float(
+        special_raw["School Age Inside regular class 80% or more of the day"]
+    )
+    special_clean = pa.table(
+        {
+            "lea_id": special_raw["State LEA ID"],
+            "district_name": special_raw["LEA Name"],
+            "total_swd": total_swd,
+            "pct_inclusive_80_plus": pc.multiply(
+                pc.divide(inclusive, _null_if_zero(total_swd)), 100.0
+            ),
+            "school_year": special_raw["School Year"],
+        }
+    )
+    special_clean = _cast_columns(
+        special_clean, {"total_swd": pa.int32(), "pct_inclusive_80_plus": pa.float32()}
+    )
+
+    return housing_clean, school_clean, special_clean
+
+
+def _write_parquet_concurrently(cfg: StorageConfig, outputs: Dict[str, Any]) -> None:
+    """
+    Write independent Parquet outputs ({relative_path: frame_or_table}) in parallel.
+
+    The writes are IO-bound (and pyarrow releases the GIL while serializing), so
+    threads overlap them; the first failure is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=len(outputs)) as ex:
+        list(ex.map(lambda item: write_parquet(cfg, *item), outputs.items()))
+
+
+def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Read bronze inputs and return the cleaned (silver) DataFrames in-memory:
+      - housing_clean
+      - school_clean
+      - special_clean
+    """
+    cfg = load_storage_config(base_dir)
+    if cfg.use_arrow:
+        housing_clean, school_clean, special_clean = build_silver_tables(base_dir)
+        return _as_frame(housing_clean), _as_frame(school_clean), _as_frame(special_clean)
+
+    ingest_date = _ingest_date()
+    p = _paths(ingest_date)
+
+    # --- Load raw (bronze) data -------------------------------------------------
+    housing_path = p["bronze_housing"]
+    special_path = p["bronze_special"]
+    school_path = xlsx_to_parquet(base_dir)
+
+    housing_raw = _read_housing_csv(cfg, housing_path)
+
+    school_raw = pd.read_parquet(BytesIO(read_bytes(cfg, school_path)), columns=_SCHOOL_COLUMNS)
+
+    special_raw = _read_special_csv(cfg, special_path)
+
+    # --- Clean / transform data -------------------------------------------------
+
+    # Housing dataset cleaning
+    housing_clean = housing_raw.rename(
+        columns={"NAME": "county_name", **_HOUSING_NUMERIC_COLUMNS}
+    ).reset_index(drop=True)
+
     # Total share of occupied housing units that are cost-burdened (30%+ of income),
     # combining all specified income tiers.
     income_burden_cols = [
@@ -106,15 +415,17 @@ def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
         "inc_50k_74_999_cost_burden_30_plus",
         "inc_75k_plus_cost_burden_30_plus",
     ]
-    housing_clean["total_cost_burden_30_plus_pct"] = (
-        housing_clean[income_burden_cols].fillna(0).sum(axis=1)
-        / housing_clean["occupied_housing_units"].replace({0: pd.NA})
-    ) * 100.0
+    # Missing tiers count as zero; zero occupied units yields NaN rather than inf.
+    burden = np.nansum(
+        housing_clean[income_burden_cols].to_numpy(dtype=np.float64, na_value=np.nan), axis=1
+    )
+    occupied = housing_clean["occupied_housing_units"].to_numpy(dtype=np.float64, na_value=np.nan)
+    occupied = np.where(occupied == 0, np.nan, occupied)
+    housing_clean["total_cost_burden_30_plus_pct"] = burden / occupied * 100.0
+    housing_clean = housing_clean.astype({c: "Float32" for c in _HOUSING_FLOAT32_COLUMNS})
 
     # School performance dataset cleaning
-    school_clean = school_raw[
-        ["schoolid", "schoolname", "systemid", "systemname", "single_score_23"]
-    ].rename(
+    school_clean = school_raw[_SCHOOL_COLUMNS].rename(
         columns={
             "schoolid": "school_id",
             "schoolname": "school_name",
@@ -123,17 +434,10 @@ def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
             "single_score_23": "ccrpi_score_2023",
         }
     ).reset_index(drop=True)
+    school_clean = school_clean.astype({"ccrpi_score_2023": "Float32"})
 
     # Special education dataset cleaning (IDEA environments)
-    special_clean = special_raw[
-        [
-            "State LEA ID",
-            "LEA Name",
-            "School Age All Educational Environments",
-            "School Age Inside regular class 80% or more of the day",
-            "School Year",
-        ]
-    ].rename(
+    special_clean = special_raw[_SPECIAL_COLUMNS].rename(
         columns={
             "State LEA ID": "lea_id",
             "LEA Name": "district_name",
@@ -147,19 +451,24 @@ def build_silver_frames(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
         "total_swd",
         "School Age Inside regular class 80% or more of the day",
     ]
-    special_clean[special_numeric_cols] = special_clean[special_numeric_cols].apply(
-        pd.to_numeric, errors="coerce"
-    )
+    for col in special_numeric_cols:
+        special_clean[col] = pd.to_numeric(special_clean[col], errors="coerce")
 
     # Share of students with disabilities who are inside regular class 80%+ of the day.
-    special_clean["pct_inclusive_80_plus"] = (
-        special_clean["School Age Inside regular class 80% or more of the day"]
-        / special_clean["total_swd"].replace({0: pd.NA})
-    ) * 100.0
-
-    special_clean = special_clean[
-        ["lea_id", "district_name", "total_swd", "pct_inclusive_80_plus", "school_year"]
-    ].reset_index(drop=True)
+    inclusive = special_clean[
+        "School Age Inside regular class 80% or more of the day"
+    ].to_numpy(dtype=np.float64, na_value=np.nan)
+    total_swd = special_clean["total_swd"].to_numpy(dtype=np.float64, na_value=np.nan)
+    total_swd = np.where(total_swd == 0, np.nan, total_swd)
+    special_clean["pct_inclusive_80_plus"] = inclusive / total_swd * 100.0
+
+    special_clean = (
+        special_clean[
+            ["lea_id", "district_name", "total_swd", "pct_inclusive_80_plus", "school_year"]
+        ]
+        .astype({"total_swd": "Int32", "pct_inclusive_80_plus": "Float32"})
+        .reset_index(drop=True)
+    )
 
     return housing_clean, school_clean, special_clean
 
@@ -184,24 +493,23 @@ def run_bronze_to_silver(base_dir: Path) -> Dict[str, Any]:
     cfg = load_storage_config(base_dir)
     ingest_date = _ingest_date()
     p = _paths(ingest_date)
-    housing_clean, school_clean, special_clean = build_silver_frames(base_dir)
+    housing_clean, school_clean, special_clean = (
+        build_silver_tables(base_dir) if cfg.use_arrow else build_silver_frames(base_dir)
+    )
 
     # --- Write cleaned data to silver as Parquet --------------------------------
     housing_out = p["silver_housing"]
     school_out = p["silver_school"]
     special_out = p["silver_special"]
 
-    buf = BytesIO()
-    housing_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, housing_out, buf.getvalue())
-
-    buf = BytesIO()
-    school_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, school_out, buf.getvalue())
-
-    buf = BytesIO()
-    special_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, special_out, buf.getvalue())
+    _write_parquet_concurrently(
+        cfg,
+        {
+            housing_out: housing_clean,
+            school_out: school_clean,
+            special_out: special_clean,
+        },
+    )
 
     return {
         "housing": {
@@ -231,31 +539,33 @@ def run_bronze_to_silver_and_gold(base_dir: Path) -> Dict[str, Any]:
     ingest_date = _ingest_date()
     p = _paths(ingest_date)
 
-    housing_clean, school_clean, special_clean = build_silver_frames(base_dir)
+    # With PIPELINE_USE_ARROW the silver data stays as Arrow tables until the gold join.
+    housing_clean, school_clean, special_clean = (
+        build_silver_tables(base_dir) if cfg.use_arrow else build_silver_frames(base_dir)
+    )
+
+    # Build gold (in-memory join; no parquet re-read)
+    gold_df = build_lea_joined_gold(
+        housing=_as_frame(housing_clean),
+        school=_as_frame(school_clean),
+        special=_as_frame(special_clean),
+    )
 
-    # Write silver
+    # Write silver + gold; the four outputs are independent, so write them concurrently.
     housing_out = p["silver_housing"]
     school_out = p["silver_school"]
     special_out = p["silver_special"]
-
-    buf = BytesIO()
-    housing_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, housing_out, buf.getvalue())
-
-    buf = BytesIO()
-    school_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, school_out, buf.getvalue())
-
-    buf = BytesIO()
-    special_clean.to_parquet(buf, index=False)
-    write_bytes(cfg, special_out, buf.getvalue())
-
-    # Build + write gold (in-memory join; no parquet re-read)
-    gold_df = build_lea_joined_gold(housing=housing_clean, school=school_clean, special=special_clean)
     gold_out = p["gold_analysis"]
-    buf = BytesIO()
-    gold_df.to_parquet(buf, index=False)
-    write_bytes(cfg, gold_out, buf.getvalue())
+
+    _write_parquet_concurrently(
+        cfg,
+        {
+            housing_out: housing_clean,
+            school_out: school_clean,
+            special_out: special_clean,
+            gold_out: gold_df,
+        },
+    )
 
     return {
         "silver": {
@@ -1,6 +1,8 @@
 -- Run with DuckDB CLI, or copy/paste into a notebook / script.
 -- Assumes you have:
---   CREATE VIEW gold AS SELECT * FROM read_parquet('<path-to>/county_joined.parquet');
+--   CREATE VIEW gold AS
+--     SELECT * FROM read_parquet('<path-to>/gold/county_analysis/**/*.parquet', hive_partitioning = true)
+--     WHERE ingest_date = 'YYYY-MM-DD';
 
 -- Quick peek
 SELECT * FROM gold LIMIT 20;
@@ -1,4 +1,7 @@
+import glob
+import json
 import os
+import re
 from pathlib import Path
 
 import duckdb
@@ -7,32 +10,84 @@ import duckdb
 def main() -> None:
 
     
+    # All ingest_date=YYYY-MM-DD partitions of the gold dataset.
     default_gold = (
         Path(__file__).resolve().parents[1]
         / "data"
         / "gold"
-        / "county_joined.parquet"
+        / "county_analysis"
+        / "**"
+        / "*.parquet"
     )
 
     gold_path = Path(os.getenv("GOLD_PARQUET_PATH") or default_gold).expanduser()
-
-    con = duckdb.connect()
+    ingest_date = (os.getenv("GOLD_INGEST_DATE") or "").strip()
+    db_path = Path(
+        os.getenv("GOLD_DUCKDB_PATH") or Path(__file__).resolve().parent / "gold.duckdb"
+    ).expanduser()
+
+    gold_files = sorted(glob.glob(str(gold_path), recursive=True))
+    if not ingest_date:
+        # Default to the latest ingest_date partition rather than mixing every run.
+        # ISO dates sort chronologically as strings.
+        ingest_dates = {
+            m.group(1) for f in gold_files if (m := re.search(r"ingest_date=([^/\\]+)", f))
+        }
+        ingest_date = max(ingest_dates, default="")
+
+    con = duckdb.connect(str(db_path))
     con.execute("SET enable_progress_bar=false;")
 
-    # Register the parquet as a view named 'gold'
-    # DuckDB doesn't allow preparing CREATE VIEW statements with parameters,
-    # so we safely inline the path by escaping single quotes.
-    gold_path_sql = str(gold_path).replace("'", "''")
-    con.execute(
-        f"CREATE OR REPLACE VIEW gold AS SELECT * FROM read_parquet('{gold_path_sql}');"
+    # Materialize the parquet into a persistent table named 'gold', so repeat runs
+    # query DuckDB's native storage instead of re-reading parquet. The table is only
+    # rebuilt when the source changes (path, ingest date, or any matching file).
+    source_key = json.dumps(
+        {
+            "path": str(gold_path),
+            "ingest_date": ingest_date,
+            "files": [[f, os.path.getmtime(f)] for f in gold_files],
+        }
     )
+    con.execute("CREATE TABLE IF NOT EXISTS gold_source (source_key VARCHAR);")
+    cached = con.execute("SELECT source_key FROM gold_source;").fetchone()
+    if cached is None or cached[0] != source_key:
+        # hive_partitioning exposes ingest_date as a column, and filtering on it
+        # prunes whole partitions at plan time.
+        where_sql = " WHERE ingest_date = ?" if ingest_date else ""
+        con.execute(
+            "CREATE OR REPLACE TABLE gold AS SELECT * FROM "
+            f"read_parquet(?, hive_partitioning = true){where_sql};",
+            [str(gold_path), *([ingest_date] if ingest_date else [])],
+        )
+        con.execute("DELETE FROM gold_source;")
+        con.execute("INSERT INTO gold_source VALUES (?);", [source_key])
 
     print(f"Gold parquet: {gold_path}")
+    print(f"DuckDB database: {db_path}")
+    if ingest_date:
+        print(f"Ingest date: {ingest_date}")
     print("\n--- Schema ---")
     print(con.execute("DESCRIBE gold;").fetchdf().to_string(index=False))
 
     print("\n--- Sample (first 10 rows) ---")
-    print(con.execute("SELECT * FROM gold LIMIT 10;").fetchdf().to_string(index=False))
+    print(
+        con.execute(
+            """
+            SELECT
+              county,
+              district_name,
+              total_cost_burden_30_plus_pct,
+              ccrpi_score_2023_mean,
+              school_count,
+              pct_inclusive_80_plus,
+              total_swd
+            FROM gold
+            LIMIT 10;
+            """
+        )
+        .fetchdf()
+        .to_string(index=False)
+    )
 
     print("\n--- Most affordable place to live (lowest cost burden %) ---")
     print(
@@ -93,7 +148,10 @@ def main() -> None:
             """
             WITH ranked AS (
               SELECT
-                *,
+                county,
+                total_cost_burden_30_plus_pct,
+                ccrpi_score_2023_mean,
+                pct_inclusive_80_plus,
                 rank() OVER (ORDER BY total_cost_burden_30_plus_pct ASC NULLS LAST) AS r_affordable,
                 rank() OVER (ORDER BY ccrpi_score_2023_mean DESC NULLS LAST) AS r_ccrpi,
                 rank() OVER (ORDER BY pct_inclusive_80_plus DESC NULLS LAST) AS r_inclusive
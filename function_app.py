@@ -1,13 +1,48 @@
 import azure.functions as func  # type: ignore[import]
+import asyncio
 import json
 import logging
+import uuid
 from pathlib import Path
 
 from bronze_to_silver import run_bronze_to_silver_and_gold
+from storage_io import load_storage_config, write_bytes
 
 
 app = func.FunctionApp()
 
+# Keep references to in-flight pipeline runs so they are not garbage-collected
+# after the HTTP response has been returned.
+_pipeline_jobs: set = set()
+
+
+def _manifest_path(job_id: str) -> str:
+    return f"gold/_manifests/{job_id}.json"
+
+
+def _write_manifest(base_dir: Path, job_id: str, body: dict) -> None:
+    cfg = load_storage_config(base_dir)
+    write_bytes(cfg, _manifest_path(job_id), json.dumps(body).encode("utf-8"))
+
+
+def _run_pipeline_job(base_dir: Path, job_id: str) -> None:
+    """
+    Run the bronze -> silver -> gold pipeline and record its outcome in the job manifest.
+
+    The "running" manifest is written by the HTTP handler before this job starts.
+    """
+    try:
+        result_summary = run_bronze_to_silver_and_gold(base_dir)
+        body = {"status": "ok", "job_id": job_id, "outputs": result_summary}
+    except Exception as exc:
+        logging.exception("Bronze -> silver -> gold pipeline failed (job %s).", job_id)
+        body = {"status": "error", "job_id": job_id, "message": str(exc)}
+
+    try:
+        _write_manifest(base_dir, job_id, body)
+    except Exception:
+        logging.exception("Failed to write manifest for pipeline job %s.", job_id)
+
 
 @app.route(route="HttpExample", auth_level=func.AuthLevel.FUNCTION)
 def HttpExample(req: func.HttpRequest) -> func.HttpResponse:
@@ -40,34 +75,49 @@ def HttpExample(req: func.HttpRequest) -> func.HttpResponse:
     methods=["GET", "POST"],
     auth_level=func.AuthLevel.FUNCTION,
 )
-def process_bronze_to_silver(req: func.HttpRequest) -> func.HttpResponse:
+async def process_bronze_to_silver(req: func.HttpRequest) -> func.HttpResponse:
     """
-    HTTP-triggered function that:
+    HTTP-triggered function that starts a pipeline run in the background:
     - Reads the three raw datasets from data/bronze
     - Cleans/transforms them
     - Writes cleaned datasets as Parquet files to data/silver
     - Builds gold layer (county-joined) in-memory from the cleaned frames
     - Writes one joined Parquet to data/gold
+
+    Returns 202 Accepted with a job id once gold/_manifests/<job_id>.json exists with
+    status "running". The run summary (or error) replaces it when the run completes;
+    poll that file.
     """
-    logging.info("Starting bronze -> silver -> gold data pipeline run.")
+    job_id = uuid.uuid4().hex
+    logging.info("Starting bronze -> silver -> gold data pipeline run (job %s).", job_id)
 
+    base_dir = Path(__file__).parent
+    loop = asyncio.get_running_loop()
     try:
-        base_dir = Path(__file__).parent
-        result_summary = run_bronze_to_silver_and_gold(base_dir)
-    except Exception as exc:  
-        logging.exception("Bronze -> silver -> gold pipeline failed.")
-        error_body = {
-            "status": "error",
-            "message": str(exc),
-        }
+        # Written before responding, so the manifest_path returned below is pollable at once.
+        await loop.run_in_executor(
+            None, _write_manifest, base_dir, job_id, {"status": "running", "job_id": job_id}
+        )
+    except Exception as exc:
+        logging.exception("Failed to write manifest for pipeline job %s.", job_id)
         return func.HttpResponse(
-            json.dumps(error_body),
+            json.dumps({"status": "error", "job_id": job_id, "message": str(exc)}),
             status_code=500,
             mimetype="application/json",
         )
 
+    job = loop.run_in_executor(None, _run_pipeline_job, base_dir, job_id)
+    _pipeline_jobs.add(job)
+    job.add_done_callback(_pipeline_jobs.discard)
+
     return func.HttpResponse(
-        json.dumps({"status": "ok", "outputs": result_summary}),
-        status_code=200,
+        json.dumps(
+            {
+                "status": "accepted",
+                "job_id": job_id,
+                "manifest_path": _manifest_path(job_id),
+            }
+        ),
+        status_code=202,
         mimetype="application/json",
-    )
\ No newline at end of file
+    )
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
-from typing import Any, Dict
 from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 import os
 import datetime
 
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from storage_io import load_storage_config, read_bytes, write_bytes
+from storage_io import StorageConfig, load_storage_config, read_bytes, write_parquet
 
 
-_COUNTY_SUFFIX_RE = re.compile(r"\s+county\b", flags=re.IGNORECASE)
-_TRAILING_STATE_RE = re.compile(r",\s*georgia\b", flags=re.IGNORECASE)
+# Map Arrow types to the nullable pandas dtypes the pandas silver path produces, so
+# Arrow-written silver (which has no pandas metadata) converts to the same frames.
+ARROW_TO_PANDAS_DTYPES = {
+    pa.string(): pd.StringDtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.float32(): pd.Float32Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+}
+
+# Trailing ", Georgia" and the " County" suffix, stripped in a single regex pass.
+_COUNTY_NOISE_RE = re.compile(r"(?:,\s*georgia\b)|(?:\s+county\b)", flags=re.IGNORECASE)
 
 
 def _normalize_county_name(value: Any) -> str | None:
@@ -30,12 +42,38 @@ def _normalize_county_name(value: Any) -> str | None:
     if not s:
         return None
 
-    s = _TRAILING_STATE_RE.sub("", s)
-    s = _COUNTY_SUFFIX_RE.sub("", s)
+    s = _COUNTY_NOISE_RE.sub("", s)
     s = s.strip()
     return s.lower() if s else None
 
 
+def _normalize_series(s: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of ``_normalize_county_name`` for a whole column.
+
+    Names repeat heavily (every school row carries its district name), so only the
+    distinct values are normalized and the result is broadcast back by position.
+    """
+    codes, uniques = pd.factorize(s)
+    normalized = (
+        pd.Series(uniques, dtype="string")
+        .str.strip()
+        .str.replace(_COUNTY_NOISE_RE.pattern, "", regex=True, case=False)
+        .str.strip()
+        .str.lower()
+        .replace("", pd.NA)
+    )
+    return pd.Series(normalized.array.take(codes, allow_fill=True), index=s.index, name=s.name)
+
+
+def _shared_categories(*columns: pd.Series) -> pd.CategoricalDtype:
+    """
+    Categorical dtype covering the values of all given columns. Casting both sides of a
+    merge key to it lets pandas join on integer codes instead of hashing strings.
+    """
+    return pd.CategoricalDtype(sorted(pd.concat(columns, ignore_index=True).dropna().unique()))
+
+
 def build_lea_joined_gold(
     housing: pd.DataFrame, school: pd.DataFrame, special: pd.DataFrame
 ) -> pd.DataFrame:
@@ -49,39 +87,70 @@ def build_lea_joined_gold(
     bronze->silver cleaning step (no need to re-read parquet).
     """
     # --- Normalize join keys ----------------------------------------------------
-    housing = housing.copy()
-    housing["county"] = housing["county_name"].map(_normalize_county_name)
+    # assign() returns new frames that share the untouched columns, so the
+    # caller's frames are left as-is without deep-copying them.
+    housing = housing.assign(county=_normalize_series(housing["county_name"]))
 
-    school = school.copy()
-    school["lea_id"] = school["lea_id"].astype(str).str.strip()
-    school["county"] = school["district_name"].map(_normalize_county_name)
+    school = school.assign(
+        lea_id=school["lea_id"].astype("string").str.strip(),
+        county=_normalize_series(school["district_name"]),
+    )
 
-    special = special.copy()
-    special["lea_id"] = special["lea_id"].astype(str).str.strip()
+    special = special.assign(lea_id=special["lea_id"].astype("string").str.strip())
 
     # --- Aggregate schools to LEA ----------------------------------------------
-    school_lea = (
-        school.dropna(subset=["lea_id"])
-        .groupby(["lea_id", "district_name", "county"], as_index=False)
-        .agg(
-            ccrpi_score_2023_mean=("ccrpi_score_2023", "mean"),
-            school_count=("school_id", "nunique"),
-        )
-    )
+    # DuckDB's vectorized hash aggregate; NULL group keys are excluded to match
+    # pandas groupby(dropna=True).
+    with duckdb.connect() as con:
+        con.register("school", school)
+        school_lea = con.sql(
+            """
+            SELECT
+              lea_id,
+              district_name,
+              county,
+              avg(ccrpi_score_2023) AS ccrpi_score_2023_mean,
+              count(DISTINCT school_id) AS school_count
+            FROM school
+            WHERE lea_id IS NOT NULL
+              AND district_name IS NOT NULL
+              AND county IS NOT NULL
+            GROUP BY lea_id, district_name, county
+            ORDER BY lea_id, district_name, county
+            """
+        ).df()
 
     # --- Join special ed by LEA -------------------------------------------------
-    lea_joined = school_lea.merge(
-        special[["lea_id", "total_swd", "pct_inclusive_80_plus", "school_year"]],
+    special = special[["lea_id", "total_swd", "pct_inclusive_80_plus", "school_year"]]
+    lea_ids = _shared_categories(school_lea["lea_id"], special["lea_id"])
+    lea_joined = school_lea.assign(lea_id=school_lea["lea_id"].astype(lea_ids)).merge(
+        special.assign(lea_id=special["lea_id"].astype(lea_ids)),
         on="lea_id",
         how="left",
     )
 
     # --- Join housing by county -------------------------------------------------
     # Keep one housing row per county (housing data is already county-level).
-    housing_county = housing.dropna(subset=["county"]).drop_duplicates(subset=["county"])
+    # A single mask over the key column, so the frame is copied once.
+    housing_county = housing.loc[housing["county"].notna() & ~housing["county"].duplicated()]
+    counties = _shared_categories(lea_joined["county"], housing_county["county"])
 
     # Only keep counties that exist in the housing dataset.
-    return lea_joined.merge(housing_county, on="county", how="inner")
+    return lea_joined.assign(county=lea_joined["county"].astype(counties)).merge(
+        housing_county.assign(county=housing_county["county"].astype(counties)),
+        on="county",
+        how="inner",
+    )
+
+
+def _read_silver(
+    cfg: StorageConfig, relative_path: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a silver Parquet file, decoding only the requested columns (all by default).
+    """
+    table = pq.read_table(BytesIO(read_bytes(cfg, relative_path)), columns=columns)
+    return table.to_pandas(types_mapper=ARROW_TO_PANDAS_DTYPES.get)
 
 
 def run_silver_to_gold(base_dir: Path) -> Dict[str, Any]:
@@ -94,19 +163,23 @@ def run_silver_to_gold(base_dir: Path) -> Dict[str, Any]:
     cfg = load_storage_config(base_dir)
     ingest_date = (os.getenv("INGEST_DATE") or datetime.date.today().isoformat()).strip()
 
-    housing_path = f"silver/housing_affordability/ingest_date={ingest_date}/housing2019-23.parquet"
-    school_path = f"silver/school_performance/ingest_date={ingest_date}/school_performance2023.parquet"
-    special_path = f"silver/special_education/ingest_date={ingest_date}/special_education2022-23.parquet"
-
-    housing = pd.read_parquet(BytesIO(read_bytes(cfg, housing_path)))
-    school = pd.read_parquet(BytesIO(read_bytes(cfg, school_path)))
-    special = pd.read_parquet(BytesIO(read_bytes(cfg, special_path)))
+    housing = _read_silver(
+        cfg, f"silver/housing_affordability/ingest_date={ingest_date}/housing2019-23.parquet"
+    )
+    school = _read_silver(
+        cfg,
+        f"silver/school_performance/ingest_date={ingest_date}/school_performance2023.parquet",
+        columns=["school_id", "lea_id", "district_name", "ccrpi_score_2023"],
+    )
+    special = _read_silver(
+        cfg,
+        f"silver/special_education/ingest_date={ingest_date}/special_education2022-23.parquet",
+        columns=["lea_id", "total_swd", "pct_inclusive_80_plus", "school_year"],
+    )
     gold = build_lea_joined_gold(housing=housing, school=school, special=special)
 
     out_path = f"gold/county_analysis/ingest_date={ingest_date}/county_joined.parquet"
-    buf = BytesIO()
-    gold.to_parquet(buf, index=False)
-    write_bytes(cfg, out_path, buf.getvalue())
+    write_parquet(cfg, out_path, gold)
 
     return {
         "rows": int(gold.shape[0]),
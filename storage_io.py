@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import functools
+import io
 import os
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Parquet writer settings shared by every silver/gold output: zstd keeps files small
+# while staying fast to decode, and column statistics let DuckDB skip row groups.
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
 
 
 @dataclass(frozen=True)
@@ -22,9 +39,16 @@ class StorageConfig:
     adls_file_system: Optional[str] = None  # container / filesystem name
     adls_base_path: str = ""  # optional prefix inside the filesystem
     adls_connection_string: Optional[str] = None  # optional for local dev
+    use_arrow: bool = False  # run bronze->silver (CSV parsing, cleaning, Parquet writes) on Arrow
 
 
+@functools.lru_cache(maxsize=4)
 def load_storage_config(base_dir: Path) -> StorageConfig:
+    """
+    Build the storage config from environment variables.
+
+    Cached per process (keyed on base_dir); settings are read once at first use.
+    """
     mode = (os.getenv("PIPELINE_STORAGE_MODE") or "local").strip().lower()
     return StorageConfig(
         mode=mode,
@@ -33,6 +57,7 @@ def load_storage_config(base_dir: Path) -> StorageConfig:
         adls_file_system=os.getenv("ADLS_FILE_SYSTEM"),
         adls_base_path=(os.getenv("ADLS_BASE_PATH") or "").strip().strip("/"),
         adls_connection_string=os.getenv("AZURE_STORAGE_CONNECTION_STRING"),
+        use_arrow=(os.getenv("PIPELINE_USE_ARROW") or "").strip().lower() in ("1", "true", "yes"),
     )
 
 
@@ -58,6 +83,15 @@ def _adls_client(cfg: StorageConfig):
     return DataLakeServiceClient(account_url=cfg.adls_account_url, credential=credential)
 
 
+@functools.lru_cache(maxsize=1)
+def _adls_file_system(cfg: StorageConfig):
+    """
+    File system client for ``cfg``, cached per process so the service client is
+    built (and the credential authenticates) only once.
+    """
+    return _adls_client(cfg).get_file_system_client(cfg.adls_file_system)
+
+
 def _adls_path(cfg: StorageConfig, relative_path: str) -> str:
     rel = relative_path.lstrip("/")
     if cfg.adls_base_path:
@@ -65,6 +99,87 @@ def _adls_path(cfg: StorageConfig, relative_path: str) -> str:
     return rel
 
 
+def last_modified(cfg: StorageConfig, relative_path: str) -> Optional[float]:
+    """
+    Return the file's last-modified time (POSIX timestamp) on either local disk or ADLS,
+    or None if the file does not exist.
+    """
+    if cfg.mode == "local":
+        p = (
+            cfg.base_dir / cfg.adls_base_path / relative_path
+            if cfg.adls_base_path
+            else cfg.base_dir / relative_path
+        )
+        return p.stat().st_mtime if p.is_file() else None
+
+    if cfg.mode != "adls":
+        raise ValueError(f"Unsupported PIPELINE_STORAGE_MODE: {cfg.mode!r}")
+
+    if not cfg.adls_file_system:
+        raise ValueError("ADLS_FILE_SYSTEM is required when PIPELINE_STORAGE_MODE=adls")
+
+    from azure.core.exceptions import ResourceNotFoundError  # type: ignore[import]
+
+    fs = _adls_file_system(cfg)
+    file_client = fs.get_file_client(_adls_path(cfg, relative_path))
+    try:
+        return file_client.get_file_properties().last_modified.timestamp()
+    except ResourceNotFoundError:
+        return None
+
+
+class _AdlsDownload(io.RawIOBase):
+    """
+    Read-only stream over an ADLS download, pulling one chunk at a time so the
+    whole file is never held in memory.
+    """
+
+    def __init__(self, downloader) -> None:
+        super().__init__()
+        self._chunks = downloader.chunks()
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def open_read(cfg: StorageConfig, relative_path: str) -> BinaryIO:
+    """
+    Open a file for sequential binary reading from either local disk or ADLS.
+
+    ADLS downloads are streamed in chunks. The returned stream is not seekable in
+    ADLS mode, so use ``read_bytes`` for formats that need random access (Parquet, XLSX).
+    """
+    if cfg.mode == "local":
+        p = (
+            cfg.base_dir / cfg.adls_base_path / relative_path
+            if cfg.adls_base_path
+            else cfg.base_dir / relative_path
+        )
+        return open(p, "rb")
+
+    if cfg.mode != "adls":
+        raise ValueError(f"Unsupported PIPELINE_STORAGE_MODE: {cfg.mode!r}")
+
+    if not cfg.adls_file_system:
+        raise ValueError("ADLS_FILE_SYSTEM is required when PIPELINE_STORAGE_MODE=adls")
+
+    fs = _adls_file_system(cfg)
+    file_client = fs.get_file_client(_adls_path(cfg, relative_path))
+    return io.BufferedReader(_AdlsDownload(file_client.download_file()))
+
+
 def read_bytes(cfg: StorageConfig, relative_path: str) -> bytes:
     """
     Read a file as bytes from either local disk or ADLS.
@@ -86,8 +201,7 @@ def read_bytes(cfg: StorageConfig, relative_path: str) -> bytes:
     if not cfg.adls_file_system:
         raise ValueError("ADLS_FILE_SYSTEM is required when PIPELINE_STORAGE_MODE=adls")
 
-    client = _adls_client(cfg)
-    fs = client.get_file_system_client(cfg.adls_file_system)
+    fs = _adls_file_system(cfg)
     file_client = fs.get_file_client(_adls_path(cfg, relative_path))
     downloader = file_client.download_file()
     return downloader.readall()
@@ -113,10 +227,107 @@ def write_bytes(cfg: StorageConfig, relative_path: str, data: bytes) -> None:
     if not cfg.adls_file_system:
         raise ValueError("ADLS_FILE_SYSTEM is required when PIPELINE_STORAGE_MODE=adls")
 
-    client = _adls_client(cfg)
-    fs = client.get_file_system_client(cfg.adls_file_system)
+    fs = _adls_file_system(cfg)
     file_client = fs.get_file_client(_adls_path(cfg, relative_path))
 
     # Overwrite semantics
     file_client.upload_data(data, overwrite=True)
 
+
+class _AdlsUpload(io.BytesIO):
+    """
+    Writable buffer that uploads its contents to ADLS when closed.
+
+    Used as a context manager; if the ``with`` block raises, nothing is uploaded.
+    """
+
+    def __init__(self, file_client) -> None:
+        super().__init__()
+        self._file_client = file_client
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            length = self.seek(0, io.SEEK_END)
+            self.seek(0)
+            # Stream the buffer itself so the payload is not copied into a new bytes object.
+            self._file_client.upload_data(self, length=length, overwrite=True)
+        finally:
+            # Close even if the upload failed, so __del__ does not retry it.
+            super().close()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Discard the partial payload instead of uploading it.
+            super().close()
+            return None
+        return super().__exit__(exc_type, exc, tb)
+
+
+class _LocalReplace(io.BufferedWriter):
+    """
+    Writable file that is written next to its destination and moved into place when closed.
+
+    Used as a context manager; if the ``with`` block raises, the temporary file is removed
+    and any existing file at the destination is left untouched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        super().__init__(io.FileIO(self._tmp_path, "xb"))
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        os.replace(self._tmp_path, self._path)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Drop the partial file instead of replacing the destination with it.
+            super().close()
+            self._tmp_path.unlink(missing_ok=True)
+            return None
+        return super().__exit__(exc_type, exc, tb)
+
+
+def open_write(cfg: StorageConfig, relative_path: str) -> BinaryIO:
+    """
+    Open a binary file for writing on either local disk or ADLS, overwriting any existing file.
+
+    Local mode writes to a temporary file and replaces the destination on close. ADLS mode
+    buffers in memory and uploads on close. Use it as a context manager, so a failed write
+    never replaces the existing file.
+    """
+    if cfg.mode == "local":
+        p = (
+            cfg.base_dir / cfg.adls_base_path / relative_path
+            if cfg.adls_base_path
+            else cfg.base_dir / relative_path
+        )
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return _LocalReplace(p)
+
+    if cfg.mode != "adls":
+        raise ValueError(f"Unsupported PIPELINE_STORAGE_MODE: {cfg.mode!r}")
+
+    if not cfg.adls_file_system:
+        raise ValueError("ADLS_FILE_SYSTEM is required when PIPELINE_STORAGE_MODE=adls")
+
+    fs = _adls_file_system(cfg)
+    file_client = fs.get_file_client(_adls_path(cfg, relative_path))
+    return _AdlsUpload(file_client)
+
+
+def write_parquet(cfg: StorageConfig, relative_path: str, data: Any) -> None:
+    """
+    Write a pandas DataFrame (no index) or a pyarrow Table as Parquet using
+    ``PARQUET_WRITE_OPTIONS``.
+    """
+    with open_write(cfg, relative_path) as f:
+        if isinstance(data, pa.Table):
+            pq.write_table(data, f, **PARQUET_WRITE_OPTIONS)
+        else:
+            data.to_parquet(f, index=False, engine="pyarrow", **PARQUET_WRITE_OPTIONS)
@@ -0,0 +1,36 @@
+from io import BytesIO
+
+import openpyxl
+import pandas as pd
+
+from bronze_to_silver import _SCHOOL_COLUMNS, _read_xlsx_columns
+
+
+def _workbook(rows) -> bytes:
+    wb = openpyxl.Workbook()
+    for row in rows:
+        wb.active.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def test_numbers_stored_as_text_match_read_excel():
+    data = _workbook(
+        [
+            ["schoolid", "schoolname", "systemid", "systemname", "single_score_23", "other"],
+            ["0101", "School A", "0601", "Fulton County", "81.5", "x"],
+            ["0102", "School B", "0601", "Fulton County", "77", None],
+            [None, None, None, None, None, None],
+            ["0103", "School C", 602, "Cobb County", "n/a", "y"],
+            [None, None, None, None, None, None],
+        ]
+    )
+
+    got = _read_xlsx_columns(data, _SCHOOL_COLUMNS)
+    expected = pd.read_excel(BytesIO(data), engine="openpyxl")[_SCHOOL_COLUMNS]
+
+    pd.testing.assert_frame_equal(got, expected)
+    # Text "0601" must parse to the number the special-ed State LEA ID joins on.
+    assert got.loc[0, "systemid"] == 601
+    assert got.loc[0, "single_score_23"] == 81.5